@@ -16,25 +16,86 @@
     completes successfully and returns `1` if there are any errors encountered during execution.
     
 '''
+import errno
+import io
+import os
 import sys
 import re
+import threading
 import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Callable
-
-import csv  # for CSV output
-import yaml  # third-party: pip install PyYAML
-from openpyxl import Workbook  # third-party: pip install openpyxl
-from docx import Document  # third-party: pip install python-docx
-from pptx import Presentation  # third-party: pip install python-pptx
-
-from colorama import Fore, Style, init  # Add colorama import
-
-init(autoreset=True)  # Initialize colorama
+from typing import Any, BinaryIO, Dict, Callable, List, Optional, Set
+
+from colorama import Fore as _Fore, Style as _Style, init  # Add colorama import
+
+
+class _NoColor:
+    """Stand-in for colorama's Fore/Style that yields no escape codes."""
+
+    def __getattr__(self, _name: str) -> str:
+        return ""
+
+
+def _is_tty(stream: Any) -> bool:
+    """Return True if stream is an open interactive terminal."""
+    return stream is not None and stream.isatty()
+
+
+# Redirected streams get plain text instead of ANSI escape codes. Prompts go
+# to stdout and log messages to stderr, so each stream is checked on its own.
+_COLOR_STDOUT = _is_tty(sys.stdout)
+_COLOR_STDERR = _is_tty(sys.stderr)
+if _COLOR_STDOUT or _COLOR_STDERR:
+    init(autoreset=True)  # Initialize colorama
+
+Fore: Any
+Style: Any
+if _COLOR_STDOUT:
+    Fore, Style = _Fore, _Style
+else:
+    Fore = Style = _NoColor()
+
+# Colors for messages written through logging (stderr)
+_ErrFore: Any
+_ErrStyle: Any
+if _COLOR_STDERR:
+    _ErrFore, _ErrStyle = _Fore, _Style
+else:
+    _ErrFore = _ErrStyle = _NoColor()
+
+# Colored prompts and messages, assembled once at import
+_PROMPT_NAMING = (
+    Fore.CYAN + Style.BRIGHT + "Enter the naming convention" + Style.RESET_ALL
+    + "(File_0_Content):"
+)
+_PROMPT_COPIES = (
+    Fore.CYAN + Style.BRIGHT + "Enter the number of copies to create: "
+    + Style.RESET_ALL
+)
+_PROMPT_AGAIN = (
+    Fore.YELLOW + Style.BRIGHT + "Do you want to run the program again? (y/n): "
+    + Style.RESET_ALL
+)
+_PROMPT_CHOICE = Fore.MAGENTA + "Enter the number of your choice:" + Style.RESET_ALL
+_MENU_HEADER = Fore.YELLOW + Style.BRIGHT + "Select file type:" + Style.RESET_ALL
+_MSG_NOT_POSITIVE = (
+    _ErrFore.RED + _ErrStyle.BRIGHT + "Input must be a positive integer."
+    + _ErrStyle.RESET_ALL
+)
+_MSG_EMPTY_NAME = (
+    _ErrFore.RED + _ErrStyle.BRIGHT + "Naming convention cannot be empty."
+    + _ErrStyle.RESET_ALL
+)
 
 # Compile regex once at module level: digit runs not preceded by '_'
 NUM_PATTERN = re.compile(r"(?<!_)(\d+)")
 
+# Translation table replacing illegal filesystem characters with '_'
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+
 # Supported file types and their descriptions
 FILE_TYPES: Dict[str, str] = {
     "md": "Markdown",
@@ -45,6 +106,17 @@ FILE_TYPES: Dict[str, str] = {
     "yaml": "YAML File",
 }
 
+# File type menu, rendered once at import
+MENU_SIZE = len(FILE_TYPES)
+_MENU_EXTENSIONS = tuple(f".{ext}" for ext in FILE_TYPES)
+_MENU_LINES = tuple(
+    Fore.YELLOW + Style.BRIGHT + f"  {index}. {desc} ({ext})" + Style.RESET_ALL
+    for index, (ext, desc) in enumerate(FILE_TYPES.items(), start=1)
+)
+
+# Directories already created during this process
+_MKDIR_CACHE: Set[Path] = set()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
@@ -59,7 +131,23 @@ def sanitize(name: str) -> str:
     Returns:
         str: A sanitized filename safe for use in filesystem operations.
     """
-    return re.sub(r'[<>:"/\\|?*]', "_", name).strip()
+    return name.translate(_SANITIZE_TABLE).strip()
+
+
+def ensure_dir(path: Path, refresh: bool = False) -> None:
+    """
+    Create a directory (and its parents) unless this process already did.
+
+    Repeated calls for the same directory are answered from an in-memory
+    cache and issue no mkdir syscall.
+    Args:
+        path (Path): Directory to create.
+        refresh (bool): Ignore the cache and recreate the directory, e.g.
+            after it was removed while the program was running.
+    """
+    if refresh or path not in _MKDIR_CACHE:
+        path.mkdir(parents=True, exist_ok=True)
+        _MKDIR_CACHE.add(path)
 
 
 def get_positive_int(prompt: str) -> int:
@@ -72,15 +160,14 @@ def get_positive_int(prompt: str) -> int:
     Raises:
         ValueError: If the input is not a positive integer.
     """
-    value = input(prompt).strip()
-    if not value.isdigit() or int(value) < 1:
-        raise ValueError(
-            Fore.RED
-            + Style.BRIGHT
-            + "Input must be a positive integer."
-            + Style.RESET_ALL
-        )
-    return int(value)
+    # int() ignores surrounding whitespace, so no separate strip is needed
+    try:
+        value = int(input(prompt))
+    except ValueError:
+        raise ValueError(_MSG_NOT_POSITIVE) from None
+    if value < 1:
+        raise ValueError(_MSG_NOT_POSITIVE)
+    return value
 
 
 def choose_extension() -> str:
@@ -91,132 +178,424 @@ def choose_extension() -> str:
     Raises:
         ValueError: If the selection is invalid.
     """
-    print(Fore.YELLOW + Style.BRIGHT + "Select file type:" + Style.RESET_ALL)
+    print(_MENU_HEADER)
 
-    for index, (ext, desc) in enumerate(FILE_TYPES.items(), start=1):
-        print(
-            Fore.YELLOW
-            + Style.BRIGHT
-            + (f"  {index}. {desc} ({ext})")
-            + Style.RESET_ALL
-        )
+    for line in _MENU_LINES:
+        print(line)
 
-    choice = input(
-        Fore.MAGENTA + "Enter the number of your choice:" + Style.RESET_ALL
-    ).strip()
-    if not choice.isdigit():
-        raise ValueError("Selection must be a number.")
-
-    idx = int(choice)
-    if idx < 1 or idx > len(FILE_TYPES):
-        raise ValueError(
-            f"Please enter a number between 1 and {len(FILE_TYPES)}.")
+    try:
+        idx = int(input(_PROMPT_CHOICE))
+    except ValueError:
+        raise ValueError("Selection must be a number.") from None
 
-    ext_key = list(FILE_TYPES)[idx - 1]
-    return f".{ext_key}"
+    if idx < 1 or idx > MENU_SIZE:
+        raise ValueError(f"Please enter a number between 1 and {MENU_SIZE}.")
 
+    return _MENU_EXTENSIONS[idx - 1]
 
-# Dispatch table mapping extensions to creation functions
-FileHandler = Callable[[Path], None]
 
 # Define functions to create files of various types
 
+# Flags for writing small files directly with os.open (O_BINARY keeps
+# Windows from translating newlines)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Constant payload of every YAML file (yaml.safe_dump({}) output)
+_YAML_BYTES = b"{}\n"
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """
+    Write data to path using a raw file descriptor.
+
+    Skips the TextIOWrapper/BufferedWriter layers of open(), which dominate
+    the cost of creating small files.
+    Args:
+        path (str): Destination file.
+        data (bytes): Contents to write.
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# The document libraries are heavy and only one is needed per batch, so each
+# builder imports its own library on first use.
+
 
-def create_xlsx(path: Path) -> None:
-    """Create a blank Excel workbook."""
-    wb = Workbook()
-    wb.active.title = "Sheet1"
-    wb.save(path)
+def _build_xlsx(buf: BinaryIO) -> None:
+    """Serialize a blank Excel workbook into buf."""
+    from openpyxl import Workbook  # third-party: pip install openpyxl
 
+    # Write-only mode streams the sheet XML instead of building the full
+    # in-memory model; it has no active sheet, so add one explicitly
+    wb = Workbook(write_only=True)
+    wb.create_sheet("Sheet1")
+    wb.save(buf)
+
+
+def _build_docx(buf: BinaryIO) -> None:
+    """Serialize a blank Word document into buf."""
+    from docx import Document  # third-party: pip install python-docx
 
-def create_docx(path: Path) -> None:
-    """Create a blank Word document."""
     doc = Document()
     doc.add_paragraph("")
-    doc.save(path)
+    doc.save(buf)
 
 
-def create_pptx(path: Path) -> None:
-    """Create a blank PowerPoint presentation."""
+def _build_pptx(buf: BinaryIO) -> None:
+    """Serialize a blank PowerPoint presentation into buf."""
+    from pptx import Presentation  # third-party: pip install python-pptx
+
     prs = Presentation()
-    prs.save(path)
+    prs.save(buf)
+
+
+_BLANK_BUILDERS: Dict[str, Callable[[BinaryIO], None]] = {
+    ".xlsx": _build_xlsx,
+    ".docx": _build_docx,
+    ".pptx": _build_pptx,
+}
+
+
+@lru_cache(maxsize=None)
+def _blank_bytes(ext: str) -> bytes:
+    """
+    Return the serialized bytes of a blank document for the given extension.
+
+    Every blank document of a type is identical, so the (expensive) XML
+    serialization and zip compression run once per extension and the
+    result is reused for every file written afterwards.
+    Args:
+        ext (str): Office extension, starting with a dot (e.g. ".xlsx").
+    Returns:
+        bytes: Contents of the blank document.
+    """
+    buf = io.BytesIO()
+    _BLANK_BUILDERS[ext](buf)
+    return buf.getvalue()
+
+
+def _warm_template(ext: str) -> None:
+    """Fill the _blank_bytes cache; errors resurface when it is used."""
+    try:
+        _blank_bytes(ext)
+    except Exception:
+        pass
+
+
+def prefetch_template(ext: str) -> Optional[threading.Thread]:
+    """
+    Start serializing the blank template for ext in a background thread.
+
+    The template is the only CPU-heavy step of an office batch. Building it
+    while the user is still answering prompts takes it off the critical path.
+    Args:
+        ext (str): File extension, starting with a dot (e.g. ".xlsx").
+    Returns:
+        threading.Thread | None: The running thread, or None if ext has no
+        template.
+    """
+    if ext not in _BLANK_BUILDERS:
+        return None
+    thread = threading.Thread(target=_warm_template, args=(ext,), daemon=True)
+    thread.start()
+    return thread
+
+
+def _md_bytes(stem: str) -> bytes:
+    """Return the contents of a Markdown file titled after stem."""
+    return f"# {stem}\n\n".encode("utf-8")
 
 
-def create_csv(path: Path) -> None:
-    """Create an empty CSV file (no rows)."""
-    with path.open("w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        # Example: writer.writerow(["Header1", "Header2"])
+# Text formats are tiny writes; they are created in batches per worker task
+_TEXT_BATCH_SIZE = 1024
 
 
-def create_md(path: Path) -> None:
-    """Create a Markdown file with a default heading."""
-    with path.open("w", encoding="utf-8") as f:
-        f.write(f"# {path.stem}\n\n")
+def _write_batch(paths: List[str], payloads: List[bytes]) -> None:
+    """Write each payload to the path at the same position."""
+    for path, data in zip(paths, payloads):
+        _write_file(path, data)
 
 
-def create_yaml(path: Path) -> None:
-    """Create a YAML file with an empty dictionary."""
-    with path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump({}, f)
+# Constant contents of the text formats that do not depend on the filename
+_TEXT_PAYLOADS: Dict[str, bytes] = {
+    ".csv": b"",
+    ".yaml": _YAML_BYTES,
+}
+
+
+def _text_payloads(ext: str, names: List[str]) -> List[bytes]:
+    """
+    Return the contents of each text file in a batch.
+    Args:
+        ext (str): Text extension, starting with a dot (e.g. ".md").
+        names (list[str]): Filenames of the batch, including the extension.
+    Returns:
+        list[bytes]: Contents for each name, in the same order.
+    """
+    if ext == ".md":
+        return [_md_bytes(os.path.splitext(name)[0]) for name in names]
+    return [_TEXT_PAYLOADS[ext]] * len(names)
+
+
+# io_uring submission queue size; each file needs up to three linked
+# entries (open, write, close), which bounds the files per submission
+_URING_ENTRIES = 2048
+_URING_FILES = _URING_ENTRIES // 3
+
+# Completion user_data packs the descriptor slot into the low bits and the
+# expected byte count of a write above them (0 for open/close requests)
+_URING_SLOT_BITS = 16
+_URING_SLOT_MASK = (1 << _URING_SLOT_BITS) - 1
+
+
+@lru_cache(maxsize=None)
+def _load_liburing() -> Any:
+    """Return the liburing module, or None when io_uring cannot be used."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import liburing  # optional third-party: pip install liburing
+    except ImportError:
+        return None
+    return liburing
 
 
-# Extension mapping
-EXTENSION_HANDLERS: Dict[str, FileHandler] = {
-    ".xlsx": create_xlsx,
-    ".docx": create_docx,
-    ".pptx": create_pptx,
-    ".csv": create_csv,
-    ".md": create_md,
-    ".yaml": create_yaml,
+def _create_files_uring(paths: List[str], payloads: List[bytes]) -> bool:
+    """
+    Create files through io_uring, submitting many files per syscall.
+
+    Each file is an open -> write -> close chain of linked requests on a
+    registered (direct) descriptor slot, so a whole chunk of files is
+    submitted with a single io_uring_enter call.
+    Args:
+        paths (list[str]): Files to create.
+        payloads (list[bytes]): Contents for each path, in the same order.
+    Returns:
+        bool: False if io_uring is unavailable and nothing was created.
+    Raises:
+        OSError: If a file could not be created or written.
+    """
+    uring = _load_liburing()
+    if uring is None:
+        return False
+
+    ring = uring.Ring()
+    try:
+        uring.io_uring_queue_init(_URING_ENTRIES, ring)
+    except OSError:
+        return False  # e.g. io_uring disabled by the kernel or a sandbox
+
+    try:
+        try:
+            uring.io_uring_register_files_sparse(ring, _URING_FILES)
+        except OSError:
+            return False  # kernel too old for direct descriptors
+
+        cqe = uring.Cqe()
+        how = uring.OpenHow(_WRITE_FLAGS, 0o644)
+        for start in range(0, len(paths), _URING_FILES):
+            chunk = paths[start:start + _URING_FILES]
+            pending = 0
+            for slot, path in enumerate(chunk):
+                data = payloads[start + slot]
+
+                sqe = uring.io_uring_get_sqe(ring)
+                uring.io_uring_prep_openat2_direct(sqe, path, how, slot)
+                uring.io_uring_sqe_set_flags(sqe, uring.IOSQE_IO_LINK)
+                sqe.user_data = slot
+                pending += 1
+
+                if data:
+                    sqe = uring.io_uring_get_sqe(ring)
+                    uring.io_uring_prep_write(sqe, slot, data)
+                    uring.io_uring_sqe_set_flags(
+                        sqe, uring.IOSQE_IO_LINK | uring.IOSQE_FIXED_FILE)
+                    sqe.user_data = (len(data) << _URING_SLOT_BITS) | slot
+                    pending += 1
+
+                sqe = uring.io_uring_get_sqe(ring)
+                uring.io_uring_prep_close_direct(sqe, slot)
+                sqe.user_data = slot
+                pending += 1
+
+            uring.io_uring_submit(ring)
+
+            # Drain every completion before reusing the descriptor slots
+            error = None
+            for _ in range(pending):
+                uring.io_uring_wait_cqe(ring, cqe)
+                entry = cqe[0]
+                user_data = entry.user_data
+                slot = user_data & _URING_SLOT_MASK
+                expected = user_data >> _URING_SLOT_BITS
+                try:
+                    # liburing raises OSError when reading a failed result
+                    res = entry.res
+                except OSError as exc:
+                    res = -(exc.errno or errno.EIO)
+                uring.io_uring_cqe_seen(ring, entry)
+                # Requests linked after a failure complete with ECANCELED
+                if error is not None:
+                    continue
+                if res < 0 and res != -errno.ECANCELED:
+                    error = OSError(-res, os.strerror(-res), chunk[slot])
+                elif expected and res != expected:
+                    # A short write (e.g. disk full) would leave a truncated
+                    # file; _write_file loops, here it is reported instead
+                    error = OSError(
+                        errno.EIO,
+                        f"Short write ({res} of {expected} bytes)",
+                        chunk[slot],
+                    )
+            if error is not None:
+                raise error
+    finally:
+        uring.io_uring_queue_exit(ring)
+
+    return True
+
+
+# Batch creation: each function creates every file of one batch and is
+# selected once per batch rather than per file
+BatchHandler = Callable[[str, List[str], List[str], int], None]
+
+
+def _create_text_batch(
+    ext: str, paths: List[str], names: List[str], workers: int
+) -> None:
+    """
+    Create a batch of Markdown, CSV or YAML files.
+    Args:
+        ext (str): Text extension, starting with a dot (e.g. ".md").
+        paths (list[str]): Files to create.
+        names (list[str]): Filenames of paths, in the same order.
+        workers (int): Maximum number of worker threads.
+    """
+    # Contents are built from the generated names, so no handler has to
+    # parse a stem back out of its path
+    payloads = _text_payloads(ext, names)
+
+    # On Linux with liburing, submit the whole batch via io_uring
+    if _create_files_uring(paths, payloads):
+        return
+
+    # One task per file costs more than the write itself, so give each
+    # worker a slice (capped at _TEXT_BATCH_SIZE)
+    size = min(_TEXT_BATCH_SIZE, -(-len(paths) // workers))
+    starts = range(0, len(paths), size)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(
+            _write_batch,
+            [paths[i:i + size] for i in starts],
+            [payloads[i:i + size] for i in starts],
+        ))
+
+
+def _create_office_batch(
+    ext: str, paths: List[str], names: List[str], workers: int
+) -> None:
+    """
+    Create a batch of blank Excel, Word or PowerPoint files.
+    Args:
+        ext (str): Office extension, starting with a dot (e.g. ".xlsx").
+        paths (list[str]): Files to create.
+        names (list[str]): Filenames of paths, in the same order (unused).
+        workers (int): Maximum number of worker threads.
+    """
+    # Serialize the template once, before the workers start
+    data = _blank_bytes(ext)
+
+    # Files are independent, so write them concurrently; the writes are
+    # disk I/O, which releases the GIL
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(partial(_write_file, data=data), paths))
+
+
+def _create_touch_batch(
+    ext: str, paths: List[str], names: List[str], workers: int
+) -> None:
+    """Create empty files for an extension without a dedicated handler."""
+    for path in paths:
+        Path(path).touch()
+
+
+BATCH_HANDLERS: Dict[str, BatchHandler] = {
+    ".xlsx": _create_office_batch,
+    ".docx": _create_office_batch,
+    ".pptx": _create_office_batch,
+    ".csv": _create_text_batch,
+    ".md": _create_text_batch,
+    ".yaml": _create_text_batch,
 }
 
 
-def main() -> int:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line options.
+    Args:
+        argv (list[str] | None): Argument list; defaults to sys.argv[1:].
+    Returns:
+        argparse.Namespace: Parsed options.
+    """
+    parser = argparse.ArgumentParser(
+        description="Bulk-create files from a naming convention.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker threads used to create files (default: CPU count).",
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be a positive integer.")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """
     Main entry point.
     Allows repeating the generation process.
+    Args:
+        argv (list[str] | None): Command-line arguments; defaults to sys.argv[1:].
     Returns:
         int: Exit code (0 for success, 1 for errors).
     """
+    args = parse_args(argv)
+    workers = min(32, args.workers)
+
     try:
+        # Create main output folder
+        out_dir = Path("Created-Files")
+        ensure_dir(out_dir)
+
         while True:
-            raw_name = input(
-                Fore.CYAN
-                + Style.BRIGHT
-                + "Enter the naming convention"
-                + Style.RESET_ALL
-                + "(File_0_Content):"
-            ).strip()
+            raw_name = input(_PROMPT_NAMING).strip()
             base = sanitize(raw_name)
             if not base:
-                logging.error(
-                    Fore.RED
-                    + Style.BRIGHT
-                    + "Naming convention cannot be empty."
-                    + Style.RESET_ALL
-                )
+                logging.error(_MSG_EMPTY_NAME)
                 return 1
 
             ext = choose_extension()
-            copies = get_positive_int(
-                Fore.CYAN
-                + Style.BRIGHT
-                + "Enter the number of copies to create: "
-                + Style.RESET_ALL
-            )
-
-            # Create main output folder
-            out_dir = Path("Created-Files")
-            out_dir.mkdir(parents=True, exist_ok=True)
+            # Build the office template while waiting for the copy count
+            prefetch = prefetch_template(ext)
+            copies = get_positive_int(_PROMPT_COPIES)
 
-            # Create subfolder for this file type
+            # Create subfolder for this file type (once per process)
             type_dir = out_dir / ext.lstrip(".")
-            type_dir.mkdir(parents=True, exist_ok=True)
-
-            matches = list(NUM_PATTERN.finditer(base))
-            if matches:
-                last = matches[-1]
+            ensure_dir(type_dir)
+
+            # Only the last digit run matters; walk the matches lazily
+            # instead of materializing them all in a list
+            last = None
+            for last in NUM_PATTERN.finditer(base):
+                pass
+            if last is not None:
                 start_num = int(last.group(1))
                 span_start, span_end = last.span(1)
             else:
@@ -225,25 +604,42 @@ def main() -> int:
 
             width = len(str(start_num + copies))
 
-            file_count = 0  # Track number of files created
-
-            for i in range(1, copies + 1):
-                new_str = str(start_num + i).zfill(width)
-                if span_start is not None:
-                    name_body = base[:span_start] + new_str + base[span_end:]
-                else:
-                    name_body = f"{base}{new_str}"
-
-                filename = f"{name_body}{ext}"
-                filepath = type_dir / filename
-
-                handler = EXTENSION_HANDLERS.get(ext)
-                if handler:
-                    handler(filepath)
-                else:
-                    filepath.touch()
-
-                file_count += 1  # Increment file count
+            # Split the name around the number once, then build all names in one pass
+            if span_start is not None:
+                prefix = base[:span_start]
+                suffix = base[span_end:] + ext
+            else:
+                prefix = base
+                suffix = ext
+
+            # A single %-template formats each name in one C-level step;
+            # literal '%' in the user's name must be escaped
+            template = (
+                prefix.replace("%", "%%")
+                + f"%0{width}d"
+                + suffix.replace("%", "%%")
+            )
+            names = [
+                template % n for n in range(start_num + 1, start_num + copies + 1)
+            ]
+            # Plain string concatenation avoids building a Path object per file
+            type_dir_str = str(type_dir) + os.sep
+            paths = [type_dir_str + name for name in names]
+
+            if prefetch is not None:
+                prefetch.join()  # reuse the template instead of building twice
+
+            # The extension is fixed for the whole batch, so dispatch once
+            create_batch = BATCH_HANDLERS.get(ext, _create_touch_batch)
+            try:
+                create_batch(ext, paths, names, workers)
+            except FileNotFoundError:
+                # The folder was moved or deleted after it was cached;
+                # recreate it and retry (files are written with O_TRUNC)
+                ensure_dir(type_dir, refresh=True)
+                create_batch(ext, paths, names, workers)
+
+            file_count = len(paths)  # Track number of files created
 
             print(
                 Fore.GREEN
@@ -252,26 +648,22 @@ def main() -> int:
                 + Style.RESET_ALL
             )
 
-            again = (
-                input(
-                    Fore.YELLOW
-                    + Style.BRIGHT
-                    + "Do you want to run the program again? (y/n): "
-                    + Style.RESET_ALL
-                )
-                .strip()
-                .lower()
-            )
+            again = input(_PROMPT_AGAIN).strip().lower()
             if again != "y":
                 break
 
         return 0
 
     except ValueError as ve:
-        logging.error(Fore.RED + str(ve) + Style.RESET_ALL)
+        logging.error(_ErrFore.RED + str(ve) + _ErrStyle.RESET_ALL)
         return 1
     except OSError as oe:
-        logging.error(Fore.RED + f"Filesystem error: {oe}" + Style.RESET_ALL)
+        logging.error(
+            _ErrFore.RED + f"Filesystem error: {oe}" + _ErrStyle.RESET_ALL)
+        return 1
+    except ImportError as ie:
+        logging.error(
+            _ErrFore.RED + f"Missing dependency: {ie}" + _ErrStyle.RESET_ALL)
         return 1
 
 